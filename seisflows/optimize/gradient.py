@@ -200,7 +200,9 @@ class Gradient:
         if os.path.exists(model_npz):
             model = Model(path=model_npz)
         elif os.path.exists(model_npy):
-            model = np.load(model_npy)
+            # Memory-map so that data are streamed from disk as needed.
+            # Copy-on-write so in-place operations don't modify the file
+            model = np.load(model_npy, mmap_mode="c")
         elif os.path.exists(model_txt):
             model = float(np.loadtxt(model_txt))
         else:
@@ -221,11 +223,10 @@ class Gradient:
 
         if isinstance(m, Model):
             path = os.path.join(self.path.scratch, f"{name}.npz")
-            m.model = m.split()  # overwrite m representation
             m.save(path=path)
         elif isinstance(m, np.ndarray):
             path = os.path.join(self.path.scratch, f"{name}.npy")
-            np.save(path=path)
+            np.save(path, m, allow_pickle=False)
         elif isinstance(m, (float, int)):
             path = os.path.join(self.path.scratch, f"{name}.txt")
             np.savetxt(path, [m])
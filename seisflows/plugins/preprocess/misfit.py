@@ -33,7 +33,8 @@ def waveform(syn, obs, nt, dt, *args, **kwargs):
     """
     wrsd = syn - obs
 
-    return np.sqrt(np.sum(wrsd * wrsd * dt))
+    # Dot product sums the squared residuals without allocating temporaries
+    return np.sqrt(np.dot(wrsd, wrsd) * dt)
 
 
 def envelope(syn, obs, nt, dt, *args, **kwargs):
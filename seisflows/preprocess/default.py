@@ -6,8 +6,11 @@ seismic data, apply preprocessing such as filtering, quantify misfit,
 and write adjoint sources that are expected by the solver.
 """
 import os
+import shutil
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
+from itertools import repeat
 from obspy import read as obspy_read
 from obspy import Stream, Trace, UTCDateTime
 
@@ -339,16 +342,46 @@ class Default:
         :type output: str
         :param output: path to save the new adjoint traces to.
         """
-        for fid in data_filenames:
-            st = self.read(fid=fid, data_format=self.syn_data_format).copy()
-            fid = os.path.basename(fid)  # drop any path before filename
-            for tr in st:
-                tr.data *= 0
+        if not data_filenames:
+            return
+
+        # Drop any path before filename and rename to match SPECFEM convention
+        adj_fids = [
+            os.path.join(output,
+                         self._rename_as_adjoint_source(os.path.basename(fid)))
+            for fid in data_filenames
+        ]
+
+        if self.syn_data_format.upper() == "ASCII":
+            # ASCII files hold a single trace each, and synthetics from a single
+            # solver run share the same time axis, so we only need to read and
+            # zero out one representative file. Remaining files are byte copies
+            self._write_zero_adjoint_trace(fid=data_filenames[0],
+                                           adj_fid=adj_fids[0])
+            with ThreadPoolExecutor() as executor:
+                list(executor.map(shutil.copyfile, repeat(adj_fids[0]),
+                                  adj_fids[1:]))
+        else:
+            # Other formats (e.g., SU) may hold a different set of traces in
+            # each file (e.g., one file per MPI rank), so zero each separately
+            for fid, adj_fid in zip(data_filenames, adj_fids):
+                self._write_zero_adjoint_trace(fid=fid, adj_fid=adj_fid)
+
+    def _write_zero_adjoint_trace(self, fid, adj_fid):
+        """
+        Read a synthetic waveform file and write it back out with all of its
+        traces zeroed, to be used as an empty adjoint trace
 
-            adj_fid = self._rename_as_adjoint_source(fid)
+        :type fid: str
+        :param fid: synthetic waveform file to read
+        :type adj_fid: str
+        :param adj_fid: adjoint trace file to write
+        """
+        st = self.read(fid=fid, data_format=self.syn_data_format).copy()
+        for tr in st:
+            tr.data *= 0
 
-            # Write traces back to the adjoint trace directory
-            self.write(st=st, fid=os.path.join(output, adj_fid))
+        self.write(st=st, fid=adj_fid)
 
     def _check_adjoint_traces(self, source_name, save_adjsrcs, synthetic):
         """Check that all adjoint traces required by SPECFEM exist"""
@@ -368,18 +401,24 @@ class Default:
         channels = [os.path.basename(syn).split('.')[2] for syn in synthetic]
         channels = list(set(channels))
 
-        st = self.read(fid=synthetic[0], data_format=self.syn_data_format)
-        for tr in st:
-            tr.data *= 0.
+        # List the directory once rather than checking each file individually
+        existing_adjsrcs = set(os.listdir(save_adjsrcs))
 
+        st = None
         for adj_sta in adj_stations:
             sta = adj_sta[0]
             net = adj_sta[1]
             for chan in channels:
                 adj_trace = adj_template.format(net=net, sta=sta, chan=chan)
-                adj_trace = os.path.join(save_adjsrcs, adj_trace)
-                if not os.path.isfile(adj_trace):
-                    self.write(st=st, fid=adj_trace)
+                if adj_trace in existing_adjsrcs:
+                    continue
+                # Only read in a template trace if something is missing
+                if st is None:
+                    st = self.read(fid=synthetic[0],
+                                   data_format=self.syn_data_format)
+                    for tr in st:
+                        tr.data *= 0.
+                self.write(st=st, fid=os.path.join(save_adjsrcs, adj_trace))
 
     def _rename_as_adjoint_source(self, fid):
         """
@@ -509,6 +548,8 @@ class Default:
         """
         observed, synthetic = self._setup_quantify_misfit(source_name)
 
+        # Read one pair of observed and synthetic files at a time so that only
+        # a single pair of streams is held in memory
         for obs_fid, syn_fid in zip(observed, synthetic):
             obs = self.read(fid=obs_fid, data_format=self.obs_data_format)
             syn = self.read(fid=syn_fid, data_format=self.syn_data_format)
@@ -539,10 +580,13 @@ class Default:
 
                 # Generate an adjoint source trace, write to file
                 if save_adjsrcs and self._generate_adjsrc:
-                    adjsrc = tr_syn.copy()
-                    adjsrc.data = self._generate_adjsrc(
-                        obs=tr_obs.data, syn=tr_syn.data,
-                        nt=tr_syn.stats.npts, dt=tr_syn.stats.delta
+                    # Only copy synthetic header, data are replaced anyway
+                    adjsrc = Trace(
+                        data=self._generate_adjsrc(
+                            obs=tr_obs.data, syn=tr_syn.data,
+                            nt=tr_syn.stats.npts, dt=tr_syn.stats.delta
+                        ),
+                        header=tr_syn.stats.copy()
                     )
                     adjsrc = Stream(adjsrc)
                     fid = os.path.basename(syn_fid)
@@ -679,10 +723,15 @@ def read_ascii(fid, origintime=None):
     """
     Read waveforms in two-column ASCII format. This is copied directly from
     pyatoa.utils.read.read_sem()
+
+    .. note::
+        Both columns are parsed in a single pass over the file, as parsing
+        text dominates the cost of reading long ASCII waveforms
     """
     try:
-        times = np.loadtxt(fname=fid, usecols=0)
-        data = np.loadtxt(fname=fid, usecols=1)
+        arr = np.loadtxt(fname=fid, usecols=(0, 1), ndmin=2)
+        times = arr[:, 0]
+        data = np.ascontiguousarray(arr[:, 1])
 
     # At some point in 2018, the Specfem developers changed how the ascii files
     # were formatted from two columns to comma separated values, and repeat
@@ -130,6 +130,10 @@ def sfparser():
     )
     submit.add_argument("-s", "--stop_after", default=None, type=str,
                         help="Optional override of the 'STOP_AFTER' parameter")
+    submit.add_argument("-c", "--clear_state", action="store_true",
+                        help="Remove the state file before submitting so that "
+                             "all tasks are re-run, rather than skipping "
+                             "previously completed tasks")
     # =========================================================================
     resume = subparser.add_parser(
         "resume", help="Re-submit previous workflow to system",
@@ -689,17 +693,25 @@ class SeisFlows:
         except AssertionError as e:
             print(msg.cli(str(e), border="=", header="parameter errror"))
 
-    def submit(self, **kwargs):
+    def submit(self, clear_state=False, **kwargs):
         """
         Main SeisFlows execution command. Submit the SeisFlows workflow to
         the chosen system, and execute seisflows.workflow.main(). Will create
         the working directory and any required paths and ensure that all
         required paths exist.
+
+        :type clear_state: bool
+        :param clear_state: remove the workflow state file before submitting,
+            so that tasks completed by a previous submission are re-run
         """
         unix.mkdir(self._args.workdir)
         unix.cd(self._args.workdir)
 
         parameters = load_yaml(self._args.parameter_file)
+        if clear_state:
+            state_file = parameters.get("path_state_file") or \
+                         os.path.join(self._args.workdir, "sfstate.txt")
+            unix.rm(state_file)
         system = custom_import("system", parameters.system)(**parameters)
         system.submit(workdir=self._args.workdir,
                       parameter_file=self._args.parameter_file)
@@ -83,6 +83,67 @@ def test_default_initialize_adjoint_traces(tmpdir):
         assert(fid.endswith(".adj"))
 
 
+def test_default_initialize_adjoint_traces_multiple_files(tmpdir):
+    """
+    Make sure each adjoint trace matches the traces of its own synthetic file
+    when initializing adjoint traces from multiple synthetics
+    """
+    preprocess = Default()
+    syn_dir = os.path.join(tmpdir, "syn")
+    unix.mkdir(syn_dir)
+
+    # ASCII: one trace per file, all sharing the same time axis
+    preprocess.syn_data_format = "ASCII"
+    semd = glob(os.path.join(TEST_DATA, "*semd"))[0]
+    data_filenames = []
+    for sta in ["S0001", "S0002", "S0003"]:
+        fid = os.path.join(syn_dir, f"AA.{sta}.BXY.semd")
+        unix.cp(semd, fid)
+        data_filenames.append(fid)
+
+    output = os.path.join(tmpdir, "adj_ascii")
+    unix.mkdir(output)
+    preprocess.initialize_adjoint_traces(data_filenames=data_filenames,
+                                         output=output)
+
+    st_syn = preprocess.read(semd, data_format="ASCII")
+    adj_fids = sorted(glob(os.path.join(output, "*.adj")))
+    assert(len(adj_fids) == 3)
+    for fid in adj_fids:
+        st = preprocess.read(fid, data_format="ASCII")
+        assert(len(st) == 1)
+        assert(st[0].stats.npts == st_syn[0].stats.npts)
+        assert(not st[0].data.any())
+
+    # SU: a different number of traces in each file, e.g., one per MPI rank
+    preprocess.syn_data_format = "SU"
+    su = glob(os.path.join(TEST_DATA, "*su"))[0]
+    st_su = preprocess.read(su, data_format="SU")
+    data_filenames = []
+    for rank, ntrace in enumerate([3, 2]):
+        st = st_su.copy()
+        for i in range(ntrace - 1):
+            st += st_su.copy()
+        for tr in st:
+            tr.data += 1.
+        fid = os.path.join(syn_dir, f"{rank}_dy_SU")
+        preprocess.write(st=st, fid=fid)
+        data_filenames.append(fid)
+
+    output = os.path.join(tmpdir, "adj_su")
+    unix.mkdir(output)
+    preprocess.initialize_adjoint_traces(data_filenames=data_filenames,
+                                         output=output)
+
+    for rank, ntrace in enumerate([3, 2]):
+        st = preprocess.read(os.path.join(output, f"{rank}_dy_SU.adj"),
+                             data_format="SU")
+        assert(len(st) == ntrace)
+        for tr in st:
+            assert(tr.stats.npts == st_su[0].stats.npts)
+            assert(not tr.data.any())
+
+
 def test_default_quantify_misfit(tmpdir):
     """
     Quantify misfit with some example data
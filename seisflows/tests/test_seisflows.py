@@ -192,3 +192,29 @@ def test_cmd_par(tmpdir, par_file):
     assert(par.strip() == parameter)
     assert(val.strip() == new_val)
 
+
+def test_cmd_submit_clear_state(tmpdir, par_file):
+    """
+    Test that submitting with `clear_state` removes the workflow state file
+    """
+    os.chdir(tmpdir)
+    state_file = os.path.join(tmpdir, "sfstate.txt")
+
+    class System:
+        """Stand in System module which does not actually submit anything"""
+        def __init__(self, **kwargs):
+            pass
+
+        def submit(self, **kwargs):
+            pass
+
+    with patch.object(sys, "argv", ["seisflows"]):
+        sf = SeisFlows(workdir=tmpdir, parameter_file="parameters.yaml")
+        with patch("seisflows.seisflows.custom_import",
+                   return_value=System):
+            open(state_file, "w").close()
+            sf.submit()
+            assert(os.path.exists(state_file))
+
+            sf.submit(clear_state=True)
+            assert(not os.path.exists(state_file))
@@ -38,6 +38,12 @@ def test_specfem_model(tmpdir):
     assert(m.model.vs[0][0] == 3500.)
 
     assert(len(m.merge() == len(m.model.vs[0]) + len(m.model.vp[0])))
+    # SPECFEM binaries are single precision, merging should not upcast
+    assert(m.vector.dtype == np.float32)
+
+    # Memory-mapped and full reads of the binary files should be identical
+    m_ff = Model(path=model_data, fmt=".bin", engine="fromfile")
+    assert(np.array_equal(m_ff.vector, m.vector))
     assert(len(m.split()) == len(m.parameters))
 
     # Check that saving and loading npz file works
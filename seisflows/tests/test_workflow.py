@@ -0,0 +1,274 @@
+"""
+Test the machinery of the Workflow module which is independent of the other
+modules, i.e., task scheduling and tracking workflow state
+"""
+import os
+import pytest
+from seisflows.tools.config import Dict
+from seisflows.workflow.forward import Forward
+
+
+class StubWorkflow(Forward):
+    """
+    Forward workflow with lightweight tasks which keep track of the order they
+    were called in. Tasks listed in `fail` raise an exception when called
+    """
+    def __init__(self, dependencies=None, fail=None, **kwargs):
+        super().__init__(**kwargs)
+        self.dependencies = dependencies
+        self.fail = fail or []
+        self.calls = []
+
+    @property
+    def task_list(self):
+        tasks = {"a": self.a, "b": self.b, "c": self.c, "d": self.d}
+        if self.dependencies is None:
+            return list(tasks.values())
+        return {tasks[name]: [tasks[dep] for dep in deps]
+                for name, deps in self.dependencies.items()}
+
+    def _task(self, name):
+        self.calls.append(name)
+        if name in self.fail:
+            raise ValueError(f"task '{name}' failed")
+
+    def a(self):
+        self._task("a")
+
+    def b(self):
+        self._task("b")
+
+    def c(self):
+        self._task("c")
+
+    def d(self):
+        self._task("d")
+
+
+def _setup(workflow):
+    """
+    Create the state file header normally written by `Forward.setup`, without
+    the directory structure and module setup that the tests do not need
+    """
+    with open(workflow.path.state_file, "w") as f:
+        f.write("# SeisFlows State File\n")
+
+
+def _names(waves):
+    """Convert waves of tasks to waves of task names for comparisons"""
+    return [[task.__name__ for task in wave] for wave in waves]
+
+
+def a():
+    pass
+
+
+def b():
+    pass
+
+
+def c():
+    pass
+
+
+def d():
+    pass
+
+
+def test_schedule_tasks_list():
+    """
+    A list of tasks is run in order, one task per wave
+    """
+    waves = Forward._schedule_tasks([a, b, c])
+    assert(_names(waves) == [["a"], ["b"], ["c"]])
+
+
+def test_schedule_tasks_diamond():
+    """
+    Independent tasks are grouped into the same wave, and dependents wait for
+    all of their dependencies
+    """
+    waves = Forward._schedule_tasks({d: [b, c], b: [a], c: [a], a: []})
+    assert(_names(waves) == [["a"], ["b", "c"], ["d"]])
+
+
+def test_schedule_tasks_cycle():
+    """
+    Cyclic dependencies can never be met and must be raised, not dropped
+    """
+    with pytest.raises(ValueError):
+        Forward._schedule_tasks({a: [], b: [a, c], c: [b]})
+
+
+def test_schedule_tasks_unknown_dependency():
+    """
+    Dependencies must themselves be tasks in the task list
+    """
+    with pytest.raises(KeyError):
+        Forward._schedule_tasks({a: [], b: [d]})
+
+
+def test_run_failure_in_wave(tmpdir):
+    """
+    A failed task does not stop the rest of its wave, but stops dependent tasks
+    from being run
+    """
+    workflow = StubWorkflow(workdir=str(tmpdir), fail=["c"],
+                            dependencies={"a": [], "b": ["a"], "c": ["a"],
+                                          "d": ["b", "c"]})
+    _setup(workflow)
+    with pytest.raises(ValueError):
+        workflow.run()
+
+    assert(workflow.calls == ["a", "b", "c"])
+    assert(workflow._states == {"a": "completed", "b": "completed",
+                                "c": "failed"})
+
+
+class StubModule:
+    """
+    Module whose public attributes are its parameters, as for the real modules
+    """
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def _stub_workflow(workdir, parameters):
+    """
+    Instantiate a StubWorkflow with stub modules in the same way that
+    `import_seisflows` instantiates modules from a parameter file
+    """
+    modules = Dict(
+        system=StubModule(ntask_max=parameters["ntask_max"]),
+        preprocess=StubModule(misfit=parameters["misfit"]),
+        solver=None, optimize=None
+    )
+    return StubWorkflow(modules=modules, workdir=workdir,
+                        parameters=parameters, **parameters)
+
+
+def test_run_config_hash(tmpdir):
+    """
+    Previously completed tasks are only skipped if the parameters that
+    determine their outcome have not changed since they were run. Otherwise
+    the workflow refuses to resume, rather than re-running tasks
+    """
+    parameters = {"system": "workstation", "preprocess": "default",
+                  "misfit": "waveform", "ntask_max": 4, "stop_after": None}
+    workflow = _stub_workflow(str(tmpdir), parameters)
+    _setup(workflow)
+    workflow.run()
+    assert(workflow.calls == ["a", "b", "c", "d"])
+
+    # Same configuration, all tasks are skipped
+    workflow = _stub_workflow(str(tmpdir), parameters)
+    workflow.run()
+    assert(workflow.calls == [])
+
+    # Changing run control or System parameters does not invalidate tasks
+    for key, val in [("stop_after", "d"), ("ntask_max", 1),
+                     ("system", "slurm")]:
+        workflow = _stub_workflow(str(tmpdir), {**parameters, key: val})
+        workflow.run()
+        assert(workflow.calls == [])
+
+    # Changing parameters which determine task outcome stops the workflow
+    workflow = _stub_workflow(str(tmpdir),
+                              {**parameters, "misfit": "traveltime"})
+    with pytest.raises(SystemExit):
+        workflow.run()
+    assert(workflow.calls == [])
+
+    # As does a state file written with a different configuration
+    with open(workflow.path.state_file, "r") as f:
+        lines = f.readlines()
+    with open(workflow.path.state_file, "w") as f:
+        for line in lines:
+            if line.startswith("config_hash:"):
+                line = "config_hash: abc123\n"
+            f.write(line)
+    workflow = _stub_workflow(str(tmpdir), parameters)
+    with pytest.raises(SystemExit):
+        workflow.run()
+
+    # Clearing the state file allows the workflow to start over
+    _setup(workflow)
+    workflow = _stub_workflow(str(tmpdir),
+                              {**parameters, "misfit": "traveltime"})
+    workflow.run()
+    assert(workflow.calls == ["a", "b", "c", "d"])
+
+
+def _read_states(workflow):
+    """Read the non-header lines of a workflow state file"""
+    with open(workflow.path.state_file, "r") as f:
+        return [line.strip() for line in f.readlines()
+                if not line.startswith(("#", "config_hash"))]
+
+
+def test_checkpoint_state_file(tmpdir):
+    """
+    Check state file contents after a workflow succeeds, and after it fails
+    """
+    workflow = StubWorkflow(workdir=str(tmpdir), fail=["c"])
+    _setup(workflow)
+    with pytest.raises(ValueError):
+        workflow.run()
+    assert(_read_states(workflow) == ["a: completed", "b: completed",
+                                      "c: failed"])
+
+    # Resuming skips completed tasks and re-runs the failed task
+    workflow = StubWorkflow(workdir=str(tmpdir))
+    workflow.run()
+    assert(workflow.calls == ["c", "d"])
+    assert(_read_states(workflow) == ["a: completed", "b: completed",
+                                      "c: completed", "d: completed"])
+
+
+def test_checkpoint_interval(tmpdir):
+    """
+    State file is only written every `checkpoint_interval` tasks, as well as
+    when a task fails
+    """
+    states = []
+
+    class IntervalWorkflow(StubWorkflow):
+        def _task(self, name):
+            self.wait_for_checkpoint()
+            states.append(_read_states(self))
+            super()._task(name)
+
+    workflow = IntervalWorkflow(workdir=str(tmpdir), checkpoint_interval=2,
+                                fail=["d"])
+    _setup(workflow)
+    with pytest.raises(ValueError):
+        workflow.run()
+
+    # State file as seen by each task, 'a' and 'b' written together
+    assert(states == [[], [], ["a: completed", "b: completed"],
+                      ["a: completed", "b: completed"]])
+    assert(_read_states(workflow) == ["a: completed", "b: completed",
+                                      "c: completed", "d: failed"])
+
+
+def test_checkpoint_skip_unchanged(tmpdir):
+    """
+    Checkpointing an unchanged state does not rewrite the state file, and
+    leaves no temporary files behind
+    """
+    workflow = StubWorkflow(workdir=str(tmpdir))
+    _setup(workflow)
+    workflow.run()
+
+    mtime = os.stat(workflow.path.state_file).st_mtime_ns
+    os.utime(workflow.path.state_file, ns=(0, 0))
+    workflow.checkpoint()
+    workflow.wait_for_checkpoint()
+    assert(os.stat(workflow.path.state_file).st_mtime_ns == 0)
+
+    workflow._states["a"] = "failed"
+    workflow.checkpoint()
+    workflow.wait_for_checkpoint()
+    assert(os.stat(workflow.path.state_file).st_mtime_ns >= mtime)
+    assert("a: failed" in _read_states(workflow))
+    assert(not os.path.exists(f"{workflow.path.state_file}.tmp"))
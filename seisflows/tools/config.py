@@ -195,9 +195,11 @@ def import_seisflows(workdir=os.getcwd(), parameter_file="parameters.yaml",
             continue
         modules[name] = custom_import(name, parameters[name])(**parameters)
 
-    # Import workflow separately by providing all the instantiated modules to it
-    workflow = \
-        custom_import("workflow", parameters["workflow"])(modules, **parameters)
+    # Import workflow separately by providing all the instantiated modules to
+    # it, as well as the parameters themselves to keep track of configuration
+    workflow = custom_import("workflow", parameters["workflow"])(
+        modules, parameters=parameters, **parameters
+    )
 
     return workflow
 
@@ -39,7 +39,7 @@ class Model:
             acceptable_parameters.append(f"reg{region}_{parameter}")
 
     def __init__(self, path=None, fmt="", parameters=None, regions="123", 
-                 flavor=None):
+                 flavor=None, engine="memmap"):
         """
         Model only needs path to model to determine model parameters. Format
         `fmt` can be provided by the user or guessed based on available file
@@ -68,10 +68,16 @@ class Model:
         :param flavor: optional, tell Model what version of SPECFEM was used
             to generate the model, acceptable values are ['2D', '3D', '3DGLOBE']
             If None, will try to guess based on file matching
+        :type engine: str
+        :param engine: how to read Fortran binary (.bin) files from disk,
+            'memmap' (default) memory-maps files so that data are paged in on
+            demand while building the model, 'fromfile' reads each file into
+            memory in full first. See `tools.specfem.read_fortran_binary`
         """
         self.path = path
         self.fmt = fmt
         self.flavor = flavor
+        self.engine = engine
         self.model = None
         if regions:
             self.regions = sorted([f"reg{i}" for i in regions])
@@ -298,28 +304,42 @@ class Model:
         This vector representation is used by the optimization library during
         model perturbation.
 
+        .. note::
+            The vector retains the dtype of the underlying model arrays, so
+            models read from SPECFEM binaries stay in single precision rather
+            than being promoted to float64
+
         :type parameter: str
         :param parameter: single parameter to retrieve model vector from,
             otherwise returns all parameters merged into single vector
         :rtype: np.array
         :return: vector representation of the model
         """
-        m = np.array([])
         if parameter is None:
             parameters = self.parameters
         else:
             parameters = [parameter]
 
-        for parameter in parameters:
-            for iproc in range(self.nproc):
-                m = np.append(m, self.model[parameter][iproc])
+        arrays = [self.model[parameter][iproc] for parameter in parameters
+                  for iproc in range(self.nproc)]
+        if not arrays:
+            return np.array([])
 
-        return m
+        return np.concatenate(arrays)
 
-    def write(self, path, fmt=None):
+    def write(self, path, fmt=None, vector=None):
         """
         Save a SPECFEM model/gradient/kernel vector loaded into memory back to
         disk in the appropriate format expected by SPECFEM
+
+        :type path: str
+        :param path: directory to write model files to
+        :type fmt: str
+        :param fmt: file format to write, defaults to the format of the model
+        :type vector: np.array
+        :param vector: optional vector to write in place of the internal model,
+            e.g., the result of vector manipulations. Must have the same
+            layout as the internal model. Does not update the internal model
         """
         unix.mkdir(path)
         if fmt is None:
@@ -332,7 +352,7 @@ class Model:
                    # ".adios": _write_model_adios   # TODO Check if  right
                    }[fmt]
 
-        save_fx(path=path)
+        save_fx(path=path, vector=vector)
 
     def split(self, vector=None):
         """
@@ -340,6 +360,10 @@ class Model:
         `model`. Does this by separating the vector based on how it was
         constructed, parameter-wise and processor-wise
 
+        .. note::
+            If all processor chunks have the same number of GLL points, the
+            returned arrays are views of `vector` and no data are copied
+
         :type vector: np.array
         :param vector: allow Model to split an input vector. If none given,
             will split the internal vector representation
@@ -349,14 +373,18 @@ class Model:
         if vector is None:
             vector = self.vector
 
-        model = Dict({key: [] for key in self.parameters})
-        for idim, key in enumerate(self.parameters):
-            for iproc in range(self.nproc):
-                imin = sum(self.ngll) * idim + sum(self.ngll[:iproc])
-                imax = sum(self.ngll) * idim + sum(self.ngll[:iproc + 1])
-                model[key].extend([vector[imin:imax]])
+        # Start and end indices of each processor chunk within a parameter
+        offsets = np.cumsum([0] + list(self.ngll))
+        npts = offsets[-1]
 
-            model[key] = np.array(model[key])
+        model = Dict()
+        for idim, key in enumerate(self.parameters):
+            block = vector[npts * idim:npts * (idim + 1)]
+            if len(set(self.ngll)) == 1:
+                model[key] = block.reshape(len(self.ngll), self.ngll[0])
+            else:
+                model[key] = np.array([block[imin:imax] for imin, imax in
+                                       zip(offsets[:-1], offsets[1:])])
         return model
 
     def check(self, min_pr=-1., max_pr=0.5):
@@ -453,7 +481,9 @@ class Model:
         Save instance attributes (model, vector, metadata) to disk as an
         .npz array so that it can be loaded in at a later time for future use
         """
-        model = self.split()
+        # `model` already defines the vector, no need to merge and split it.
+        # Shallow copy so that coordinates are not added to the internal model
+        model = Dict(self.model)
         if self.coordinates:
             # Incase we have model parameters called 'x' or 'z', rename for save
             model["x_coord"] = self.coordinates["x"]
@@ -703,7 +733,7 @@ class Model:
             self.path, self.fnfmt(val=parameter, ext=".bin"))
         )
         for fid in sorted(fids):  # make sure were going in numerical order
-            array.append(read_fortran_binary(fid))
+            array.append(read_fortran_binary(fid, engine=self.engine))
 
         # !!! Causes a visible deprecation warning from NumPy but setting
         # !!! array type as 'object' causes problems with pickling and
@@ -750,7 +780,7 @@ class Model:
 
         return np.array(array)
 
-    def _write_model_fortran_binary(self, path):
+    def _write_model_fortran_binary(self, path, vector=None):
         """
         Save a SPECFEM model back to Fortran binary format.
         Data are written as single precision floating point numbers
@@ -760,9 +790,19 @@ class Model:
             This function mimics that behavior by tacking on the boundary data
             as 'int32' at the top and bottom of the data array.
             https://docs.oracle.com/cd/E19957-01/805-4939/6j4m0vnc4/index.html
+
+        :type path: str
+        :param path: directory to write model files to
+        :type vector: np.array
+        :param vector: optional vector to write in place of the internal model
         """
+        if vector is None:
+            model = self.model
+        else:
+            model = self.split(vector=vector)
+
         for parameter in self.parameters:
-            for i, data in enumerate(self.model[parameter]):
+            for i, data in enumerate(model[parameter]):
                 filename = self.fnfmt(i=i, val=parameter, ext=".bin")
                 filepath = os.path.join(path, filename)
                 write_fortran_binary(arr=data, filename=filepath)
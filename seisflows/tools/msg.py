@@ -2,12 +2,23 @@
 SeisFlows messages tool. For providing a uniform look to SeisFlows print
 and log statements that end up in stdout or in log files.
 """
-from textwrap import wrap
+from functools import lru_cache
+from textwrap import TextWrapper
 
 # Unicode degree symbol for log statements etc.
 DEG = u"\N{DEGREE SIGN}"
 
 
+@lru_cache(maxsize=None)
+def _wrapper(width):
+    """
+    TextWrapper used by `cli`, cached per line width so that the wrapper and
+    its internal state are only created once rather than on every call
+    """
+    return TextWrapper(width=width, break_long_words=False)
+
+
+@lru_cache(maxsize=64)
 def mjr(val, char="="):
     """
     Message formatter used to block off sections in log files with visually
@@ -31,6 +42,7 @@ def mjr(val, char="="):
     return f"\n{char*80}\n{val:^80s}\n{char*80}"
 
 
+@lru_cache(maxsize=64)
 def mnr(val, char="/"):
     """
     Message formatter used to block off sections in log files with visually
@@ -137,10 +149,14 @@ def cli(text="", items=None, wraplen=80, header=None, border=None, hchar="/"):
     if header is not None:
         output_str += f"{header.upper():^{wraplen}}\n"
         output_str += f"{hchar * len(header):^{wraplen}}\n"
-    # Format the actual input string with a text wrap
+    # Format the actual input string with a text wrap. Short, single-line
+    # text would be returned as-is by the wrapper so we skip wrapping
     if text:
-        output_str += "\n".join(wrap(text, width=wraplen,
-                                     break_long_words=False))
+        if len(text) <= wraplen and text.isprintable() and \
+                text == text.strip():
+            output_str += text
+        else:
+            output_str += "\n".join(_wrapper(wraplen).wrap(text))
     # Add list items in order of list
     if items:
         # Sometimes text is blank so we don't need the double newline
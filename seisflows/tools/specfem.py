@@ -260,7 +260,7 @@ def setpar_vel_model(file, model):
     setpar(key="nbmodels", val=len(model), file=file)
 
 
-def read_fortran_binary(filename):
+def read_fortran_binary(filename, engine="fromfile"):
     """
     Reads Fortran-style unformatted binary data into numpy array.
 
@@ -272,23 +272,35 @@ def read_fortran_binary(filename):
 
     :type filename: str
     :param filename: full path to the Fortran unformatted binary file to read
+    :type engine: str
+    :param engine: method used to get data off disk. 'fromfile' reads the
+        entire file into memory. 'memmap' memory-maps the file (read-only) so
+        that the OS pages data in on demand, which avoids an intermediate
+        copy when reading large model files
     :rtype: np.array
     :return: numpy array with data with data read in as type Float32
     """
+    assert(engine in ["fromfile", "memmap"]), \
+        f"`engine` must be 'fromfile' or 'memmap'"
+
     nbytes = os.path.getsize(filename)
     with open(filename, "rb") as file:
         # read size of record
         file.seek(0)
         n = np.fromfile(file, dtype="int32", count=1)[0]
 
+        # Determine data offset and length, excluding any record markers
         if n == nbytes - 8:
-            file.seek(4)
-            data = np.fromfile(file, dtype="float32")
-            return data[:-1]
+            offset, count = 4, n // 4
+        else:
+            offset, count = 0, nbytes // 4
+
+        if engine == "memmap":
+            return np.memmap(file, dtype="float32", mode="r", offset=offset,
+                             shape=(count,))
         else:
-            file.seek(0)
-            data = np.fromfile(file, dtype="float32")
-            return data
+            file.seek(offset)
+            return np.fromfile(file, dtype="float32", count=count)
 
 
 def write_fortran_binary(arr, filename):
@@ -308,7 +320,7 @@ def write_fortran_binary(arr, filename):
         unformatted Fortran binary
     """
     buffer = np.array([4 * len(arr)], dtype="int32")
-    data = np.array(arr, dtype="float32")
+    data = np.asarray(arr, dtype="float32")  # no copy if already float32
 
     with open(filename, "wb") as file:
         buffer.tofile(file)
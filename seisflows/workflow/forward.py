@@ -6,6 +6,10 @@ Forward class represents the BASE workflow. All other workflows will build off
 of the scaffolding defined by the Forward class.
 """
 import os
+import sys
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from time import asctime
 
 from seisflows import logger
@@ -13,6 +17,10 @@ from seisflows.tools import msg, unix
 from seisflows.tools.config import Dict
 from seisflows.tools.model import Model
 
+# Single background thread that writes state files, so that checkpointing does
+# not block the workflow. One worker ensures that writes happen in order
+_checkpoint_executor = ThreadPoolExecutor(max_workers=1)
+
 
 class Forward:
     """
@@ -41,6 +49,14 @@ class Forward:
         `seisflows print tasks` to get task list for given workflow) to stop
         workflow after, allowing user to prematurely stop a workflow to explore
         intermediate results or debug.
+    :type checkpoint_interval: int
+    :param checkpoint_interval: number of completed tasks between writes of
+        the state file. Defaults to 1, i.e., write after every task. Larger
+        values reduce disk writes, but tasks completed since the last write
+        will be re-run if a workflow is resumed, so should only be used if all
+        tasks can be safely re-run. The Inversion workflow requires a value of
+        1. The state file is always written if a task fails and at the end of
+        the task list.
     :type export_traces: bool
     :param export_traces: export all waveforms that are generated by the
         external solver to `path_output`. If False, solver traces stored in
@@ -76,11 +92,17 @@ class Forward:
         including models, kernels, gradient and residuals.
     ***
     """
+    # Pending state file write. Kept on the class, not the instance, so that
+    # the workflow can still be pickled when passed to the System module
+    _checkpoint_future = None
+
     def __init__(self, modules=None, data_case="data", stop_after=None,
-                 export_traces=False, export_residuals=False,
+                 checkpoint_interval=1, export_traces=False,
+                 export_residuals=False,
                  workdir=os.getcwd(), path_output=None, path_data=None,
                  path_state_file=None, path_model_init=None,
-                 path_model_true=None, path_eval_grad=None, **kwargs):
+                 path_model_true=None, path_eval_grad=None, parameters=None,
+                 **kwargs):
         """
         Set default forward workflow parameters
 
@@ -88,13 +110,20 @@ class Forward:
         :param modules: list of sub-modules that will be established as class
             attributes by the setup() function. Should not need to be set by the
             user
+        :type parameters: dict
+        :param parameters: all parameters loaded from the parameter file, used
+            to determine whether previously completed tasks are still valid.
+            Set by `seisflows.tools.config.import_seisflows`, should not need
+            to be set by the user
         """
-        # Keep modules hidden so that seisflows configure doesnt count them
-        # as 'parameters'
+        # Keep modules and parameters hidden so that seisflows configure doesnt
+        # count them as 'parameters'
         self._modules = modules
+        self._parameters = parameters
 
         self.data_case = data_case
         self.stop_after = stop_after
+        self.checkpoint_interval = checkpoint_interval
         self.export_traces = export_traces
         self.export_residuals = export_residuals
 
@@ -114,6 +143,13 @@ class Forward:
         self._required_modules = ["system", "solver"]
         self._acceptable_data_cases = ["data", "synthetic"]
         self._optional_modules = ["preprocess"]
+        # Modules whose parameters determine the outcome of tasks. System
+        # parameters only control where and how tasks are run
+        self._config_modules = ["workflow", "solver", "preprocess", "optimize"]
+        # Workflow parameters which control how a workflow is run, but not the
+        # outcome of its tasks. Changing these does not require re-running tasks
+        self._run_control_parameters = ["stop_after", "checkpoint_interval",
+                                        "path_state_file"]
 
         # Read in any existing state file which keeps track of workflow tasks
         self._states = {}
@@ -123,6 +159,12 @@ class Forward:
                     continue
                 key, val = line.strip().split(":")
                 self._states[key] = val.strip()
+        # Configuration that previously completed tasks were run with
+        self._state_config_hash = self._states.pop("config_hash", None)
+
+        # Lazily computed by their respective properties
+        self._task_names_cache = None
+        self._config_hash_cache = None
 
     @property
     def task_list(self):
@@ -141,24 +183,185 @@ class Forward:
             teardown tasks (run once per workflow, not once per iteration) are
             not included.
 
+        .. note::
+            The task list may instead be defined as a dictionary which maps
+            each task to a list of the tasks it depends on. Tasks are then
+            grouped into 'waves' of tasks that do not depend on one another,
+            see `_schedule_tasks` for details. Tasks in a wave are run one
+            after another, because tasks share process-wide state (e.g., the
+            current working directory, System and scratch directories) and
+            are therefore not safe to run concurrently.
+
         :rtype: list
         :return: list of methods to call in order during a workflow
         """
         return [self.evaluate_initial_misfit]
 
+    @property
+    def _task_names(self):
+        """
+        Names of the tasks in the task list. The task list is fixed for a
+        given workflow so the names are only collected once, rather than
+        rebuilding the task list each time we need to validate a task name
+
+        :rtype: list of str
+        :return: names of the methods in the task list, in the order they run
+        """
+        if self._task_names_cache is None:
+            self._task_names_cache = [
+                task.__name__ for wave in self._schedule_tasks(self.task_list)
+                for task in wave
+            ]
+        return self._task_names_cache
+
+    @staticmethod
+    def _schedule_tasks(task_list):
+        """
+        Group tasks into waves, where the tasks in a wave depend only on tasks
+        in previous waves, and not on one another.
+
+        A list of tasks is run in order, one task per wave. A dictionary
+        mapping each task to a list of the tasks it depends on is sorted
+        topologically (Kahn's algorithm), with each wave containing the tasks
+        whose dependencies are all met by previous waves.
+
+        :type task_list: list or dict
+        :param task_list: list of tasks, or dictionary of tasks and their
+            dependencies, as returned by `task_list`
+        :rtype: list of list
+        :return: waves of tasks, in the order that they should be run
+        """
+        if not isinstance(task_list, dict):
+            return [[task] for task in task_list]
+
+        # Keep track of the number of unmet dependencies for each task
+        nunmet = {task: len(deps) for task, deps in task_list.items()}
+        dependents = {task: [] for task in task_list}
+        for task, deps in task_list.items():
+            for dep in deps:
+                if dep not in dependents:
+                    raise KeyError(
+                        f"task '{task.__name__}' depends on "
+                        f"'{getattr(dep, '__name__', dep)}' which is not a "
+                        f"task in the task list"
+                    )
+                dependents[dep].append(task)
+
+        waves = []
+        wave = [task for task, n in nunmet.items() if n == 0]
+        while wave:
+            waves.append(wave)
+            next_wave = []
+            for task in wave:
+                for dependent in dependents[task]:
+                    nunmet[dependent] -= 1
+                    if nunmet[dependent] == 0:
+                        next_wave.append(dependent)
+            wave = next_wave
+
+        # Tasks in a cycle never have their dependencies met
+        if sum(len(wave) for wave in waves) != len(task_list):
+            scheduled = [task for wave in waves for task in wave]
+            unscheduled = [task.__name__ for task in task_list
+                           if task not in scheduled]
+            raise ValueError(f"task list dependencies contain a cycle, "
+                             f"involving tasks: {unscheduled}")
+
+        return waves
+
+    @staticmethod
+    def _run_task(func):
+        """
+        Run a single task, returning rather than raising any exception so that
+        the remaining tasks in the same wave are allowed to finish
+
+        :type func: method
+        :param func: task to run
+        :rtype: Exception or None
+        :return: the exception raised by the task, None if it succeeded
+        """
+        try:
+            func()
+        except Exception as e:
+            return e
+
+    @property
+    def _config_hash(self):
+        """
+        Hash of the configuration that determines the outcome of tasks, i.e.,
+        the parameters of the workflow, solver, preprocess and optimize
+        modules, excluding those that only control how the workflow is run.
+        System parameters (e.g., `ntask_max`, `partition`) never change the
+        outcome of a task and are not included. Written to the state file so
+        that a workflow is not resumed with a different configuration than its
+        completed tasks were run with. If no parameters were provided, falls
+        back to the workflow's data case and paths.
+
+        :rtype: str
+        :return: hexadecimal digest of the workflow configuration
+        """
+        if self._config_hash_cache is None:
+            if self._parameters is None:
+                config = {"data_case": self.data_case, **self.path}
+            else:
+                names = self._get_config_parameter_names()
+                config = {key: val for key, val in self._parameters.items()
+                          if key in names}
+            config = json.dumps(config, sort_keys=True, default=str)
+            self._config_hash_cache = hashlib.sha1(config.encode()).hexdigest()
+        return self._config_hash_cache
+
+    def _get_config_parameter_names(self):
+        """
+        Names of the parameters that determine the outcome of tasks. Module
+        parameters are their public attributes and paths, in the same way that
+        `seisflows configure` determines the parameters written to the
+        parameter file. Module choices (e.g., `solver: specfem2d`) are also
+        included.
+
+        :rtype: set of str
+        :return: parameter names to include in the configuration hash
+        """
+        modules = self._modules or {}
+        names = set(self._config_modules)
+        for name in self._config_modules:
+            module = self if name == "workflow" else modules.get(name)
+            if not module:
+                continue
+            for key, val in vars(module).items():
+                if key.startswith("_"):
+                    continue
+                elif key == "path":
+                    names.update(f"path_{key_}" for key_ in val)
+                # Modules assigned to the workflow during setup()
+                elif key in modules:
+                    continue
+                else:
+                    names.add(key)
+
+        return names - set(self._run_control_parameters)
+
     def check(self):
         """
         Check that workflow has required modules. Run their respective checks
+
+        .. note::
+            Parameter errors are raised explicitly as AssertionErrors, rather
+            than with `assert` statements, so that checks are still performed
+            when Python is run with optimizations (-O)
         """
         # Check that required modules have been instantiated
         for req_mod in self._required_modules:
-            assert(self._modules[req_mod]), (
-                f"'{req_mod}' is a required module for workflow " 
-                f"'{self.__class__.__name__}'"
-            )
+            if not self._modules[req_mod]:
+                raise AssertionError(
+                    f"'{req_mod}' is a required module for workflow "
+                    f"'{self.__class__.__name__}'"
+                )
             # Make sure that the modules are actually instances (not e.g., str)
-            assert(hasattr(self._modules[req_mod], "__class__")), \
-                f"workflow attribute {req_mod} must be an instance"
+            if not hasattr(self._modules[req_mod], "__class__"):
+                raise AssertionError(
+                    f"workflow attribute {req_mod} must be an instance"
+                )
 
             # Run check function of these modules
             self._modules[req_mod].check()
@@ -177,27 +380,42 @@ class Forward:
         # 1) real data located in `path.data`, or 2) a target model to generate
         # synthetic data, locaed in `path.model_true`
         if self.data_case is not None and bool(self._modules.preprocess):
-            assert(self.data_case.lower() in self._acceptable_data_cases), \
-                f"`data_case` must be in {self._acceptable_data_cases}"
-            if self.data_case.lower() == "data":
-                assert(self.path.data is not None and
-                       os.path.exists(self.path.data)), \
-                    f"importing data with `data_case`=='data' requires " \
+            data_case = self.data_case.lower()
+            if data_case not in self._acceptable_data_cases:
+                raise AssertionError(
+                    f"`data_case` must be in {self._acceptable_data_cases}"
+                )
+            if data_case == "data" and not (
+                    self.path.data is not None and
+                    os.path.exists(self.path.data)):
+                raise AssertionError(
+                    f"importing data with `data_case`=='data' requires "
                     f"'path_data' to exist"
-            elif self.data_case.lower() == "synthetic":
-                assert(self.path.model_true is not None and
-                       os.path.exists(self.path.model_true)), \
-                    f"creating data with `data_case`=='synthetic' requires " \
+                )
+            elif data_case == "synthetic" and not (
+                    self.path.model_true is not None and
+                    os.path.exists(self.path.model_true)):
+                raise AssertionError(
+                    f"creating data with `data_case`=='synthetic' requires "
                     f"'path_model_true' to exist and point to a target model"
+                )
         elif self.data_case is None:
             logger.warning(f"`workflow.data_case` is None, SeisFlows will not "
                            f"look for data for data-synthetic comparison"
                            )
 
-        if self.stop_after is not None:
-            _task_names = [task.__name__ for task in self.task_list]
-            assert(self.stop_after in _task_names), \
-                f"workflow parameter `stop_after` must match {_task_names}"
+        if not (isinstance(self.checkpoint_interval, int) and
+                self.checkpoint_interval >= 1):
+            raise AssertionError(
+                f"workflow parameter `checkpoint_interval` must be an "
+                f"integer >= 1"
+            )
+
+        if self.stop_after is not None and \
+                self.stop_after not in self._task_names:
+            raise AssertionError(
+                f"workflow parameter `stop_after` must match {self._task_names}"
+            )
 
     def setup(self):
         """
@@ -252,18 +470,68 @@ class Forward:
         Saves active SeisFlows working state to disk as a text files such that
         the workflow can be resumed following a crash, pause or termination of
         workflow.
+
+        .. note::
+            The state file is written by a background thread so that the
+            workflow is not blocked by disk I/O. Writes are performed in order,
+            and an error raised by the previous write is raised here
+        """
+        self.wait_for_checkpoint()
+        Forward._checkpoint_future = _checkpoint_executor.submit(
+            self._write_state_file, self._get_states()
+        )
+
+    def wait_for_checkpoint(self):
+        """
+        Block until the most recent state file write has finished. Raises any
+        exception encountered by the background write
+        """
+        if Forward._checkpoint_future is not None:
+            future, Forward._checkpoint_future = \
+                Forward._checkpoint_future, None
+            future.result()
+
+    def _get_states(self):
+        """
+        Snapshot of the current workflow state to be written to the state file.
+        Copied so that the workflow can continue to modify its state while the
+        snapshot is being written
+
+        :rtype: dict
+        :return: workflow state, keys are written as 'key: val' lines
+        """
+        states = dict(self._states)
+        states["config_hash"] = self._config_hash
+
+        return states
+
+    def _write_state_file(self, states):
+        """
+        Rewrite the state file with the given states, preserving header lines.
+        The file is written to a temporary file and then renamed, so that a
+        crash during writing cannot leave behind a partial state file. Writing
+        is skipped if the contents of the state file would not change.
+
+        :type states: dict
+        :param states: workflow state to write to the state file
         """
         # Grab State file header values
         with open(self.path.state_file, "r") as f:
-            lines = f.readlines()
+            old_text = f.read()
 
-        with open(self.path.state_file, "w") as f:
-            # Rewrite header values
-            for line in lines:
-                if line.startswith("#"):
-                    f.write(line)
-            for key, val in self._states.items():
-                f.write(f"{key}: {val}\n")
+        lines = [line for line in old_text.splitlines(keepends=True)
+                 if line.startswith("#")]
+        lines += [f"{key}: {val}\n" for key, val in states.items()]
+        text = "".join(lines)
+        if text == old_text:
+            return
+
+        tmp_file = f"{self.path.state_file}.tmp"
+        with open(tmp_file, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.path.state_file)
 
     def run(self):
         """
@@ -274,30 +542,83 @@ class Forward:
         logger.info(msg.mjr(f"RUNNING {self.__class__.__name__.upper()} "
                             f"WORKFLOW"))
 
-        for func in self.task_list:
+        # Determine the tasks to run once, up front. Allows user to prematurely
+        # stop a workflow after a given task
+        waves = self._schedule_tasks(self.task_list)
+        if self.stop_after:
+            stop = self._task_names.index(self.stop_after) + 1
+            run_names = self._task_names[:stop]
+            waves = [[task for task in wave if task.__name__ in run_names]
+                     for wave in waves]
+            waves = [wave for wave in waves if wave]
+
+        # Completed tasks are only valid for the configuration they were run
+        # with. Silently re-running them is not safe (e.g., an inversion would
+        # mix optimization history from two configurations), so the user must
+        # explicitly start over
+        if self._state_config_hash not in [None, self._config_hash] and \
+                "completed" in self._states.values():
+            logger.critical(msg.cli(
+                f"The workflow configuration has changed since the state file "
+                f"was written, so previously completed tasks are no longer "
+                f"valid. To start the workflow over, rerun with "
+                f"'seisflows submit --clear_state', or restore the previous "
+                f"parameters to resume the workflow.",
+                items=[f"state file: {self.path.state_file}"],
+                header="state file error", border="=")
+            )
+            sys.exit(-1)
+        self._state_config_hash = self._config_hash
+
+        # Bind frequently accessed attributes once, outside of the task loop
+        states = self._states
+        run_task = self._run_task
+        checkpoint_interval = self.checkpoint_interval
+
+        ntasks = 0
+        ncompleted = 0
+        for wave in waves:
+            ntasks += len(wave)
             # Skip over functions which have already been completed
-            if (func.__name__ in self._states.keys()) and (
-                    self._states[func.__name__] == "completed"):
-                logger.info(f"'{func.__name__}' has already been run, skipping")
+            tasks = []
+            for func in wave:
+                name = func.__name__
+                if states.get(name) == "completed":
+                    logger.info(f"'{name}' has already been run, skipping")
+                else:
+                    tasks.append(func)
+            if not tasks:
                 continue
+
             # Otherwise attempt to run functions that have failed or are
             # encountered for the first time
-            else:
-                try:
-                    func()
-                    self._states[func.__name__] = "completed"
-                    self.checkpoint()
-                except Exception as e:
-                    self._states[func.__name__] = "failed"
+            errors = [run_task(func) for func in tasks]
+
+            for func, error in zip(tasks, errors):
+                if error is None:
+                    states[func.__name__] = "completed"
+                else:
+                    states[func.__name__] = "failed"
+
+            # Dependent tasks in later waves are not run if any task failed
+            for error in errors:
+                if error is not None:
                     self.checkpoint()
-                    raise
-            # Allow user to prematurely stop a workflow after a given task
-            if self.stop_after and func.__name__ == self.stop_after:
-                logger.info(f"stop workflow at `stop_after`: {self.stop_after}")
-                break
+                    self.wait_for_checkpoint()
+                    raise error
+
+            # Only write state file every `checkpoint_interval` tasks
+            ncompleted += len(tasks)
+            if ncompleted >= checkpoint_interval:
+                self.checkpoint()
+                ncompleted = 0
+
+        if self.stop_after:
+            logger.info(f"stop workflow at `stop_after`: {self.stop_after}")
 
         self.checkpoint()
-        logger.info(f"finished all {len(self.task_list)} tasks in task list")
+        self.wait_for_checkpoint()
+        logger.info(f"finished all {ntasks} tasks in task list")
 
     def evaluate_initial_misfit(self):
         """
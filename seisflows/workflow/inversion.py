@@ -95,6 +95,8 @@ class Inversion(Migration):
         self._optimize_name = optimize
         self._thrifty_status = False
         self._required_modules = ["system", "solver", "preprocess", "optimize"]
+        # Extending an inversion with `end` should not re-run completed tasks
+        self._run_control_parameters += ["start", "end"]
 
         # Grab iteration from state file
         if "iteration" in self._states:
@@ -134,32 +136,46 @@ class Inversion(Migration):
 
     def check(self):
         """
-        Checks inversion-specific parameters
+        Checks inversion-specific parameters. Errors are raised explicitly,
+        see `Forward.check`
         """
         super().check()
 
-        assert(1 <= self.start <= self.end), \
-            f"Incorrect START or END parameter. Values must be in order: " \
-            f"1 <= {self.start} <= {self.end}"
+        if not 1 <= self.start <= self.end:
+            raise AssertionError(
+                f"Incorrect START or END parameter. Values must be in order: "
+                f"1 <= {self.start} <= {self.end}"
+            )
 
-        assert(self.start <= self.iteration <= self.end), \
-            f"`workflow.iteration` must be between `start` and `end`"
+        if not self.start <= self.iteration <= self.end:
+            raise AssertionError(
+                f"`workflow.iteration` must be between `start` and `end`"
+            )
 
-        if self.iteration > 1:
-            assert(os.path.exists(self.path.eval_grad)), \
-                f"scratch path `eval_grad` does not exist but should for a " \
+        if self.iteration > 1 and not os.path.exists(self.path.eval_grad):
+            raise AssertionError(
+                f"scratch path `eval_grad` does not exist but should for a "
                 f"workflow with `iteration` >= 1"
+            )
 
         if self.iteration >= self.end + 1:
             logger.warning(f"current `iteration` is >= chosen `end` point. "
                            f"Inversion workflow will not `run`")
 
-        if self.thrifty:
-            assert(self._optimize_name == "LBFGS"), (
+        if self.thrifty and self._optimize_name != "LBFGS":
+            raise AssertionError(
                 f"a `thrifty` inversion requires the optimization module to be "
                 f"set as 'LBFGS'"
             )
 
+        # Tasks completed since the last checkpoint are re-run on resume, but
+        # inversion tasks such as the line search are not safe to re-run
+        if self.checkpoint_interval != 1:
+            raise AssertionError(
+                f"an inversion requires `checkpoint_interval` == 1, tasks such "
+                f"as `perform_line_search` cannot be safely re-run"
+            )
+
     def setup(self):
         """
         Assigns modules as attributes of the workflow. I.e., `self.solver` to
@@ -193,23 +209,19 @@ class Inversion(Migration):
             else:
                 break
 
-    def checkpoint(self):
+        # Make sure the final state file write has finished before returning
+        self.wait_for_checkpoint()
+
+    def _get_states(self):
         """
-        Add an additional line in the state file to keep track of iteration,
+        Add an additional line in the state file to keep track of iteration
         """
-        super().checkpoint()
-        with open(self.path.state_file, "r") as f:
-            lines = f.readlines()
-        # Clear out the previous 'iteration' line and add in new
-        for i, line in enumerate(lines[:]):
-            if "iteration:" in line:
-                lines.pop(i)
-                break
-        lines.append(f"iteration: {self.iteration}")
+        states = super()._get_states()
+        # Clear out the previous 'iteration' entry and add in new
+        states.pop("iteration", None)
+        states["iteration"] = self.iteration
 
-        # Rewrite checkpoint file with new iteration line
-        with open(self.path.state_file, "w") as f:
-            f.writelines(lines)
+        return states
 
     def evaluate_objective_function(self, save_residuals=False, **kwargs):
         """
@@ -325,7 +337,7 @@ class Inversion(Migration):
         gradient calculated by migration from their native SPECFEM model format
         into optimization vectors that can be used for model updates.
         """
-        super().evaluate_gradient_from_kernels()
+        gradient = self._scale_gradient()
 
         # Rename kernels (K) and gradient (G) output files by iteration number
         # so they don't get overwritten by future iterations.
@@ -343,10 +355,8 @@ class Inversion(Migration):
             logger.debug(f"{src} -> {dst}")
             unix.mv(src, dst)
 
-        # Expose the gradient to the optimization library
-        gradient = Model(path=os.path.join(self.path.eval_grad, "gradient"),
-                         regions=self.solver._regions
-                         )
+        # Expose the gradient to the optimization library. Use the gradient
+        # that was just written rather than re-reading it from disk
         self.optimize.save_vector(name="g_new", m=gradient)
 
     def initialize_line_search(self):
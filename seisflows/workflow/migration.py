@@ -179,6 +179,17 @@ class Migration(Forward):
         scaling the gradient by the model vector (log dm --> dm) and applying
         an optional mask function to the gradient.
         """
+        self._scale_gradient()
+
+    def _scale_gradient(self):
+        """
+        Scales the misfit kernel to the gradient, writes the gradient to
+        `path.eval_grad` and (optionally) exports it to disk. Returns the
+        gradient so that subclasses can use it without re-reading it from disk
+
+        :rtype: seisflows.tools.model.Model
+        :return: the scaled (and optionally masked) gradient
+        """
         logger.info("scaling gradient to absolute model perturbations")
 
         # Check that kernel files exist before attempting to manipulate
@@ -208,20 +219,23 @@ class Migration(Forward):
         model = Model(path=dst, parameters=self.solver._parameters,
                       regions=self.solver._regions)
 
-        # Merge to vector and convert to absolute perturbations:
+        # Merge to vector once and convert to absolute perturbations in place:
         # log dm --> dm (see Eq.13 Tromp et al 2005)
-        gradient.update(vector=gradient.vector * model.vector)
-        gradient.write(path=os.path.join(self.path.eval_grad, "gradient"))
+        vector = gradient.vector
+        vector *= model.vector
 
-        # Apply an optional mask to the gradient
+        # Apply an optional mask to the gradient. The unmasked gradient is
+        # written out first so that it can be inspected by the User
         if self.path.mask:
             logger.info("applying mask function to gradient")
             mask = Model(path=self.path.mask)
-            unix.mv(src=os.path.join(self.path.eval_grad, "gradient"),
-                    dst=os.path.join(self.path.eval_grad, "gradient_nomask"))
+            gradient.write(path=os.path.join(self.path.eval_grad,
+                                             "gradient_nomask"),
+                           vector=vector)
+            vector *= mask.vector
 
-            gradient.update(vector=gradient.vector * mask.vector)
-            gradient.write(path=os.path.join(self.path.eval_grad, "gradient"))
+        gradient.update(vector=vector)
+        gradient.write(path=os.path.join(self.path.eval_grad, "gradient"))
 
         # Export gradient to disk
         if self.export_gradient:
@@ -230,3 +244,5 @@ class Migration(Forward):
             dst = os.path.join(self.path.output, "gradient")
             unix.cp(src, dst)
 
+        return gradient
+